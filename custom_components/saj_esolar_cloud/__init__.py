@@ -8,9 +8,17 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
-from .coordinator import SAJeSolarDataUpdateCoordinator
+from .const import (
+    BURST_STORAGE_VERSION,
+    CONF_MQTT_ENABLED,
+    CONF_MQTT_TOPIC,
+    DEFAULT_MQTT_TOPIC,
+    DOMAIN,
+)
+from .coordinator import SAJeSolarDataUpdateCoordinator, burst_storage_key
+from .services import async_setup_services, async_unload_services
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -26,10 +34,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data[CONF_PASSWORD],
     )
 
+    await coordinator.async_load_burst_budget(entry.entry_id)
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.async_stop_burst)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await async_setup_services(hass)
+
+    if entry.options.get(CONF_MQTT_ENABLED):
+        # Imported here so MQTT stays optional
+        from .publisher import SAJeSolarMqttPublisher
+
+        publisher = SAJeSolarMqttPublisher(
+            hass,
+            coordinator,
+            entry.options.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC),
+        )
+        entry.async_on_unload(coordinator.async_add_listener(publisher.async_handle_update))
+        publisher.async_handle_update()
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
@@ -37,5 +62,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_unload_services(hass)
 
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored burst budget of a deleted config entry."""
+    await Store(hass, BURST_STORAGE_VERSION, burst_storage_key(entry.entry_id)).async_remove()
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,160 @@
+"""Minute-level battery series for the SAJ eSolar integration."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import logging
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import BATTERY_SERIES_FIELDS, BATTERY_TIME_KEYS, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_battery_samples(samples: Iterable[dict[str, Any]]) -> list[tuple[float, dict[str, Any]]]:
+    """Return (timestamp, sample) pairs for the samples that carry a time."""
+    parsed = []
+    for sample in samples:
+        for key in BATTERY_TIME_KEYS:
+            if value := sample.get(key):
+                break
+        else:
+            continue
+
+        naive_dt = dt_util.parse_datetime(str(value))
+        if naive_dt is None:
+            continue
+        # The portal reports plant local time without an offset
+        if naive_dt.tzinfo is None:
+            naive_dt = naive_dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        parsed.append((naive_dt.timestamp(), sample))
+
+    return parsed
+
+
+class BatterySeries:
+    """Compact time-indexed buffer of minute-level battery samples.
+
+    Samples are kept in parallel arrays of doubles sorted by timestamp, with
+    NaN marking a missing value, and anything older than the window is dropped.
+    """
+
+    def __init__(self, window: int, fields: Iterable[str] = BATTERY_SERIES_FIELDS) -> None:
+        """Initialize the buffer."""
+        self._window = window
+        self._times = array("d")
+        self._values = {field: array("d") for field in fields}
+
+    def __len__(self) -> int:
+        """Return the number of buffered samples."""
+        return len(self._times)
+
+    @property
+    def newest(self) -> float | None:
+        """Return the timestamp of the most recent sample."""
+        return self._times[-1] if self._times else None
+
+    def merge(self, samples: Iterable[tuple[float, dict[str, Any]]]) -> int:
+        """Append samples newer than the buffer and trim it to the window.
+
+        Every poll returns an overlapping series, so anything at or before the
+        newest buffered timestamp is already known and skipped.
+        """
+        newest = self.newest
+        added = 0
+        for timestamp, sample in sorted(samples, key=lambda item: item[0]):
+            if newest is not None and timestamp <= newest:
+                continue
+            self._times.append(timestamp)
+            for field, values in self._values.items():
+                try:
+                    values.append(float(sample[field]))
+                except (KeyError, TypeError, ValueError):
+                    values.append(math.nan)
+            newest = timestamp
+            added += 1
+
+        if newest is not None:
+            cut = bisect_left(self._times, newest - self._window)
+            if cut:
+                del self._times[:cut]
+                for values in self._values.values():
+                    del values[:cut]
+
+        return added
+
+    def stats(self, field: str, start: float | None = None, end: float | None = None) -> dict[str, float] | None:
+        """Return min, max and mean of a field between start and end."""
+        lo = 0 if start is None else bisect_left(self._times, start)
+        hi = len(self._times) if end is None else bisect_left(self._times, end)
+        values = [value for value in self._values[field][lo:hi] if not math.isnan(value)]
+        if not values:
+            return None
+
+        return {
+            "min": min(values),
+            "max": max(values),
+            "mean": round(sum(values) / len(values), 2),
+        }
+
+
+async def async_import_battery_statistics(
+    hass: HomeAssistant,
+    series: BatterySeries,
+    since: datetime | None,
+) -> datetime | None:
+    """Import hourly battery statistics for every completed hour after since.
+
+    Returns the start of the last imported hour so the caller can resume.
+    """
+    if "recorder" not in hass.config.components or series.newest is None:
+        return since
+
+    # Imported here so the recorder is only loaded when it is set up
+    from homeassistant.components.recorder.models import (
+        StatisticData,
+        StatisticMetaData,
+    )
+    from homeassistant.components.recorder.statistics import (
+        async_add_external_statistics,
+    )
+
+    # Step through UTC hours so DST changes and half-hour offsets still line
+    # up with the recorder's hourly buckets
+    current_hour = dt_util.utc_from_timestamp(series.newest).replace(
+        minute=0, second=0, microsecond=0
+    )
+    hour = since + timedelta(hours=1) if since else current_hour - timedelta(hours=1)
+    rows: dict[str, list[StatisticData]] = {field: [] for field in BATTERY_SERIES_FIELDS}
+    last_imported = since
+
+    while hour < current_hour:
+        start = hour.timestamp()
+        for field, field_rows in rows.items():
+            if stats := series.stats(field, start, start + 3600):
+                field_rows.append(StatisticData(start=hour, **stats))
+        last_imported = hour
+        hour += timedelta(hours=1)
+
+    for field, field_rows in rows.items():
+        if not field_rows:
+            continue
+        config = BATTERY_SERIES_FIELDS[field]
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"SAJ {config['name']}",
+            source=DOMAIN,
+            statistic_id=f"{DOMAIN}:{config['statistic']}",
+            unit_of_measurement=config["unit"],
+        )
+        async_add_external_statistics(hass, metadata, field_rows)
+        _LOGGER.debug("Imported %d hourly %s statistics", len(field_rows), field)
+
+    return last_imported
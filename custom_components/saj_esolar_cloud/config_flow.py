@@ -7,10 +7,11 @@ from typing import Any
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
-from . import DOMAIN
+from .const import CONF_MQTT_ENABLED, CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC, DOMAIN
 from .coordinator import SAJeSolarDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,6 +28,14 @@ class SAJeSolarConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SAJeSolarOptionsFlow:
+        """Get the options flow for this handler."""
+        return SAJeSolarOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -59,3 +68,56 @@ class SAJeSolarConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+class SAJeSolarOptionsFlow(config_entries.OptionsFlow):
+    """Handle SAJ eSolar options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the MQTT fan-out options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            # Without the MQTT integration every publish would fail
+            if user_input[CONF_MQTT_ENABLED] and "mqtt" not in self.hass.config.components:
+                errors["base"] = "mqtt_not_set_up"
+            elif _valid_topic_template(user_input[CONF_MQTT_TOPIC]):
+                return self.async_create_entry(title="", data=user_input)
+            else:
+                errors["base"] = "invalid_topic"
+
+        options = self._config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MQTT_ENABLED,
+                        default=options.get(CONF_MQTT_ENABLED, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_MQTT_TOPIC,
+                        default=options.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC),
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+def _valid_topic_template(template: str) -> bool:
+    """Return True if the template yields a valid MQTT publish topic."""
+    # Imported here so MQTT stays optional
+    from homeassistant.components.mqtt.util import valid_publish_topic
+
+    if "{device_sn}" not in template:
+        return False
+    try:
+        valid_publish_topic(template.format(device_sn="sn"))
+    except (KeyError, IndexError, ValueError, vol.Invalid):
+        return False
+    return True
@@ -16,6 +16,93 @@ BASE_URL: Final = "https://iop.saj-electric.com/saj"
 # Update interval
 UPDATE_INTERVAL: Final = 300  # 5 minutes
 
+# Minute-level battery series kept from findBatteryRealTimeList
+BATTERY_SERIES_WINDOW: Final = 7200  # 2 hours, enough to import the last full hour
+BATTERY_STATS_WINDOW: Final = 3600  # 1 hour
+
+# Sample keys that may carry the timestamp of a battery sample. These are not
+# confirmed against a real response; a warning is logged if none is present.
+BATTERY_TIME_KEYS: Final = ("dataTime", "updateDate", "time")
+
+# Battery sample fields kept in the series and imported as statistics
+BATTERY_SERIES_FIELDS = {
+    "batVoltage": {
+        "name": "Battery Voltage",
+        "statistic": "battery_voltage",
+        "unit": "V",
+    },
+    "batTemperature": {
+        "name": "Battery Temperature",
+        "statistic": "battery_temperature",
+        "unit": "°C",
+    },
+}
+
+# The chart call is heavy, so it only runs this often to reconcile the
+# locally integrated energy counters (and on the first poll of each day)
+CHART_UPDATE_INTERVAL: Final = 3600  # 1 hour
+
+# Locally integrated energy counters and the totals they are reconciled
+# against, from the chart viewBean or (todayElectricity) the plant detail
+ENERGY_COUNTERS = {
+    "gridImport": "buyElec",
+    "gridExport": "sellElec",
+    "batteryCharge": "chargeElec",
+    "batteryDischarge": "dischargeElec",
+    "pvGeneration": "todayElectricity",
+    "consumption": "useElec",
+}
+
+# Longer gaps between power samples are not integrated
+ENERGY_MAX_GAP: Final = 900  # 15 minutes
+
+# Burst mode polls only the real-time endpoints at a faster interval
+BURST_DEFAULT_INTERVAL: Final = 30  # seconds
+BURST_MIN_INTERVAL: Final = 30  # seconds
+BURST_MAX_DURATION: Final = 3600  # 1 hour
+BURST_DAILY_REQUEST_BUDGET: Final = 480  # 120 polls, 1 hour at 30 seconds
+BURST_REQUESTS_PER_POLL: Final = 4  # login, device power, battery, logout
+
+# The used burst budget is stored so restarts and reloads do not reset it
+BURST_STORAGE_VERSION: Final = 1
+BURST_STORAGE_SAVE_DELAY: Final = 10  # seconds
+
+# History export through the plant_chart endpoint, one request per day
+EXPORT_GRANULARITIES: Final = ("day", "5min")
+EXPORT_MAX_CONCURRENCY: Final = 4
+EXPORT_REQUESTS_PER_SECOND: Final = 2
+
+# Power series exported per 5 minute slot, one value per slot from midnight.
+# These are not confirmed against a real response; a day without any of them
+# or with more values than slots is skipped and a warning is logged.
+EXPORT_SLOT_MINUTES: Final = 5
+EXPORT_SLOT_SERIES: Final = ("pvPower", "loadPower", "gridPower", "batteryPower")
+
+# Daily totals exported from the chart viewBean
+EXPORT_DAY_FIELDS: Final = (
+    "useElec",
+    "buyElec",
+    "sellElec",
+    "chargeElec",
+    "dischargeElec",
+)
+
+# Options
+CONF_MQTT_ENABLED: Final = "mqtt_enabled"
+CONF_MQTT_TOPIC: Final = "mqtt_topic"
+
+# Topic for the MQTT snapshot of each device, {device_sn} is substituted
+DEFAULT_MQTT_TOPIC: Final = "saj_esolar_cloud/{device_sn}/state"
+
+# Services
+SERVICE_PROFILE_REFRESH: Final = "profile_refresh"
+SERVICE_START_BURST: Final = "start_burst"
+SERVICE_EXPORT_HISTORY: Final = "export_history"
+
+# Number of entries returned by the profile_refresh service
+PROFILE_TOP_FUNCTIONS: Final = 20
+PROFILE_TOP_ALLOCATIONS: Final = 10
+
 # Device info
 DEVICE_INFO = {
     "identifiers": {(DOMAIN, "h1")},
@@ -153,6 +240,48 @@ H1_SENSORS = {
         "state_class": "total",
         "unit": "t",
     },
+    "estimatedGridImport": {
+        "name": "Estimated Today Grid Import",
+        "icon": "mdi:transmission-tower-import",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit": "kWh",
+    },
+    "estimatedGridExport": {
+        "name": "Estimated Today Grid Export",
+        "icon": "mdi:transmission-tower-export",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit": "kWh",
+    },
+    "estimatedBatteryCharge": {
+        "name": "Estimated Today Battery Charge",
+        "icon": "mdi:battery-charging",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit": "kWh",
+    },
+    "estimatedBatteryDischarge": {
+        "name": "Estimated Today Battery Discharge",
+        "icon": "mdi:battery-minus",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit": "kWh",
+    },
+    "estimatedPvGeneration": {
+        "name": "Estimated Today Generation",
+        "icon": "mdi:solar-power",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit": "kWh",
+    },
+    "estimatedConsumption": {
+        "name": "Estimated Today Consumption",
+        "icon": "mdi:home-lightning-bolt",
+        "device_class": "energy",
+        "state_class": "total_increasing",
+        "unit": "kWh",
+    },
     "lastUploadTime": {
         "name": "Last Update",
         "icon": "mdi:clock",
@@ -248,6 +377,48 @@ H1_SENSORS = {
         "state_class": "measurement",
         "unit": "°C",
     },
+    "batVoltageMin": {
+        "name": "Battery Voltage Min (1h)",
+        "icon": "mdi:lightning-bolt",
+        "device_class": "voltage",
+        "state_class": "measurement",
+        "unit": "V",
+    },
+    "batVoltageMax": {
+        "name": "Battery Voltage Max (1h)",
+        "icon": "mdi:lightning-bolt",
+        "device_class": "voltage",
+        "state_class": "measurement",
+        "unit": "V",
+    },
+    "batVoltageMean": {
+        "name": "Battery Voltage Mean (1h)",
+        "icon": "mdi:lightning-bolt",
+        "device_class": "voltage",
+        "state_class": "measurement",
+        "unit": "V",
+    },
+    "batTemperatureMin": {
+        "name": "Battery Temperature Min (1h)",
+        "icon": "mdi:thermometer",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit": "°C",
+    },
+    "batTemperatureMax": {
+        "name": "Battery Temperature Max (1h)",
+        "icon": "mdi:thermometer",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit": "°C",
+    },
+    "batTemperatureMean": {
+        "name": "Battery Temperature Mean (1h)",
+        "icon": "mdi:thermometer",
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit": "°C",
+    },
     "pvDirection": {
         "name": "PV Direction",
         "icon": "mdi:solar-power",
@@ -282,6 +453,15 @@ H1_SENSORS = {
         "device_class": None,
         "state_class": None,
         "unit": None,
+    },
+
+    # Integration Sensors
+    "burstBudgetRemaining": {
+        "name": "Burst Requests Remaining",
+        "icon": "mdi:timer-sand",
+        "device_class": None,
+        "state_class": "measurement",
+        "unit": None,
     }
 }
 
@@ -1,18 +1,46 @@
 """DataUpdateCoordinator for SAJ eSolar integration."""
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import logging
 from typing import Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.util import dt as dt_util
 
-from .const import BASE_URL, DOMAIN, ENDPOINTS, UPDATE_INTERVAL
+from .battery import BatterySeries, async_import_battery_statistics, parse_battery_samples
+from .const import (
+    BASE_URL,
+    BATTERY_SERIES_FIELDS,
+    BATTERY_SERIES_WINDOW,
+    BATTERY_STATS_WINDOW,
+    BATTERY_TIME_KEYS,
+    BURST_DAILY_REQUEST_BUDGET,
+    BURST_REQUESTS_PER_POLL,
+    BURST_STORAGE_SAVE_DELAY,
+    BURST_STORAGE_VERSION,
+    CHART_UPDATE_INTERVAL,
+    DOMAIN,
+    ENDPOINTS,
+    UPDATE_INTERVAL,
+)
+from .energy import EnergyIntegrator, realtime_flows
 
 _LOGGER = logging.getLogger(__name__)
 
+HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/x-www-form-urlencoded",
+}
+
+def burst_storage_key(entry_id: str) -> str:
+    """Return the storage key of the burst budget of a config entry."""
+    return f"{DOMAIN}.{entry_id}.burst_budget"
+
 class SAJeSolarDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the SAJ eSolar API."""
 
@@ -34,151 +62,361 @@ class SAJeSolarDataUpdateCoordinator(DataUpdateCoordinator):
         self.username = username
         self.password = password
         self._plant_id = None
+        self.plant_uid: str | None = None
+        self.device_sn: str | None = None
+        self.battery_series = BatterySeries(BATTERY_SERIES_WINDOW)
+        self._battery_imported_hour: datetime | None = None
+        self._battery_time_warned = False
+        self._burst_until: datetime | None = None
+        self._unsub_burst: CALLBACK_TYPE | None = None
+        self._burst_budget_date: date | None = None
+        self._burst_requests_used = 0
+        self._burst_store: Store | None = None
+        self.energy = EnergyIntegrator()
+        self._chart_fetched_at: datetime | None = None
+        self._force_full_refresh = False
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via API."""
-        try:
-            # Login
-            login_data = {
-                "lang": "en",
-                "username": self.username,
-                "password": self.password,
-                "rememberMe": "true",
-            }
-            headers = {
-                "Accept": "application/json",
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
+    @property
+    def burst_active(self) -> bool:
+        """Return True while burst polling is running."""
+        return self._burst_until is not None
+
+    @property
+    def burst_budget_remaining(self) -> int:
+        """Return the number of burst requests left for today."""
+        if self._burst_budget_date != dt_util.now().date():
+            return BURST_DAILY_REQUEST_BUDGET
+        return max(BURST_DAILY_REQUEST_BUDGET - self._burst_requests_used, 0)
 
-            async with self.session.post(
-                f"{BASE_URL}{ENDPOINTS['login']}",
-                data=login_data,
-                headers=headers,
-            ) as resp:
-                if resp.status == 401:
-                    raise ConfigEntryAuthFailed("Invalid authentication")
-                if resp.status != 200:
-                    raise UpdateFailed(f"Login failed with status {resp.status}")
-
-            # Get plant list
-            client_date = datetime.now().strftime("%Y-%m-%d")
-            plant_list_data = f"pageNo=&pageSize=&orderByIndex=&officeId=&clientDate={client_date}&runningState=&selectInputType=1&plantName=&deviceSn=&type=&countryCode=&isRename=&isTimeError=&systemPowerLeast=&systemPowerMost="
-
-            async with self.session.post(
-                f"{BASE_URL}{ENDPOINTS['plant_list']}",
-                data=plant_list_data,
-                headers=headers,
-            ) as resp:
-                if resp.status != 200:
-                    raise UpdateFailed(f"Failed to get plant list: {resp.status}")
-                plant_info = await resp.json()
-
-                if not plant_info.get("plantList"):
-                    raise UpdateFailed("No plants found")
-
-                # Use the first plant if plant_id is not set
-                if self._plant_id is None:
-                    self._plant_id = 0
-
-                plant = plant_info["plantList"][self._plant_id]
-                plant_uid = plant["plantuid"]
-
-            # Get plant details
-            plant_detail_data = f"plantuid={plant_uid}&clientDate={client_date}"
-            async with self.session.post(
-                f"{BASE_URL}{ENDPOINTS['plant_detail']}",
-                data=plant_detail_data,
-                headers=headers,
-            ) as resp:
-                if resp.status != 200:
-                    raise UpdateFailed(f"Failed to get plant details: {resp.status}")
-                plant_details = await resp.json()
-
-            # Get device power info (specific to H1)
-            device_sn = plant_details["plantDetail"]["snList"][0]
-            epoch_ms = int(datetime.now().timestamp() * 1000)
-
-            async with self.session.post(
-                f"{BASE_URL}{ENDPOINTS['device_power']}?plantuid=&devicesn={device_sn}&_={epoch_ms}",
-                headers=headers,
-            ) as resp:
-                if resp.status != 200:
-                    raise UpdateFailed(f"Failed to get device power info: {resp.status}")
-                device_power = await resp.json()
-
-            # Get plant chart data for historical information
-            today = datetime.now()
-            previous_day = (today - timedelta(days=1)).strftime("%Y-%m-%d")
-            next_day = (today + timedelta(days=1)).strftime("%Y-%m-%d")
-            current_month = today.strftime("%Y-%m")
-            previous_month = (today.replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
-            next_month = (today.replace(day=28) + timedelta(days=4)).strftime("%Y-%m")
-            current_year = today.strftime("%Y")
-            previous_year = str(int(current_year) - 1)
-            next_year = str(int(current_year) + 1)
-
-            chart_url = (
-                f"{BASE_URL}{ENDPOINTS['plant_chart']}?"
-                f"plantuid={plant_uid}&"
-                f"chartDateType=1&"
-                f"energyType=0&"
-                f"clientDate={client_date}&"
-                f"deviceSnArr={device_sn}&"
-                f"chartCountType=2&"
-                f"previousChartDay={previous_day}&"
-                f"nextChartDay={next_day}&"
-                f"chartDay={client_date}&"
-                f"previousChartMonth={previous_month}&"
-                f"nextChartMonth={next_month}&"
-                f"chartMonth={current_month}&"
-                f"previousChartYear={previous_year}&"
-                f"nextChartYear={next_year}&"
-                f"chartYear={current_year}&"
-                f"elecDevicesn={device_sn}&"
-                f"_={epoch_ms}"
+    async def async_load_burst_budget(self, entry_id: str) -> None:
+        """Restore today's burst request usage so restarts do not reset it."""
+        self._burst_store = Store(self.hass, BURST_STORAGE_VERSION, burst_storage_key(entry_id))
+        if stored := await self._burst_store.async_load():
+            self._burst_budget_date = date.fromisoformat(stored["date"])
+            self._burst_requests_used = stored["requests_used"]
+
+    def _use_burst_budget(self, requests: int) -> None:
+        """Count burst requests against today's budget, starting a new day if needed."""
+        today = dt_util.now().date()
+        if self._burst_budget_date != today:
+            self._burst_budget_date = today
+            self._burst_requests_used = 0
+        self._burst_requests_used += requests
+
+        if self._burst_store is not None:
+            self._burst_store.async_delay_save(
+                lambda: {
+                    "date": self._burst_budget_date.isoformat(),
+                    "requests_used": self._burst_requests_used,
+                },
+                BURST_STORAGE_SAVE_DELAY,
             )
 
-            async with self.session.get(
-                chart_url,
-                headers=headers,
-            ) as resp:
-                if resp.status != 200:
-                    raise UpdateFailed(f"Failed to get plant chart data: {resp.status}")
-                chart_data = await resp.json()
-
-            # Get battery real-time information
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:00")
-            battery_data = f"devicesn={device_sn}&timeStr={current_time}"
-
-            async with self.session.post(
-                f"{BASE_URL}{ENDPOINTS['battery_info']}",
-                data=battery_data,
-                headers=headers,
-            ) as resp:
-                if resp.status != 200:
-                    raise UpdateFailed(f"Failed to get battery info: {resp.status}")
-                battery_info = await resp.json()
-
-                # Extract the most recent battery data (first item in the first array)
-                if battery_info.get("result") == "OK" and battery_info.get("list"):
-                    battery_data = battery_info["list"][0][0] if battery_info["list"][0] else {}
-                else:
-                    battery_data = {}
-
-            # Combine all data
-            data = {
-                "plant_info": plant_info,
-                "plant_details": plant_details,
-                "device_power": device_power,
-                "chart_data": chart_data,
-                "battery_info": battery_data,
-            }
+    async def async_start_burst(self, duration: timedelta, interval: timedelta) -> None:
+        """Poll the real-time endpoints every interval for the given duration."""
+        if self.burst_budget_remaining < BURST_REQUESTS_PER_POLL:
+            raise HomeAssistantError("Daily burst request budget exhausted")
+
+        self.async_stop_burst()
+        self._burst_until = dt_util.now() + duration
+        self._unsub_burst = async_call_later(self.hass, duration, self._async_end_burst)
+        self.update_interval = interval
+        _LOGGER.debug("Burst polling every %s for %s", interval, duration)
+        await self.async_refresh()
 
-            # Logout and clear session
-            await self.session.post(f"{BASE_URL}/logout", headers=headers)
-            return data
+    @callback
+    def async_stop_burst(self) -> None:
+        """Cancel burst polling and return to the normal interval."""
+        if self._unsub_burst is not None:
+            self._unsub_burst()
+        self._async_end_burst()
+
+    @callback
+    def _async_end_burst(self, _now: datetime | None = None) -> None:
+        """Return to the normal update interval."""
+        self._unsub_burst = None
+        self._burst_until = None
+        # Takes effect once the already scheduled refresh has run
+        self.update_interval = timedelta(seconds=UPDATE_INTERVAL)
+
+    async def async_full_refresh(self) -> None:
+        """Refresh every endpoint now, including the chart, even during a burst."""
+        self._force_full_refresh = True
+        try:
+            await self.async_refresh()
+        finally:
+            self._force_full_refresh = False
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data via API."""
+        try:
+            if (
+                self.burst_active
+                and not self._force_full_refresh
+                and self.data is not None
+                and self.device_sn is not None
+            ):
+                if self.burst_budget_remaining >= BURST_REQUESTS_PER_POLL:
+                    return await self._async_update_realtime_data()
+                _LOGGER.info("Daily burst request budget exhausted, ending burst")
+                self.async_stop_burst()
+
+            return await self._async_update_all_data()
 
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error communicating with API: {err}")
         except Exception as err:
             raise UpdateFailed(f"Error fetching data: {err}")
+
+    async def _async_update_all_data(self) -> dict[str, Any]:
+        """Fetch every endpoint."""
+        await self.async_login(self.session)
+
+        # Get plant list
+        client_date = dt_util.now().strftime("%Y-%m-%d")
+        plant_list_data = f"pageNo=&pageSize=&orderByIndex=&officeId=&clientDate={client_date}&runningState=&selectInputType=1&plantName=&deviceSn=&type=&countryCode=&isRename=&isTimeError=&systemPowerLeast=&systemPowerMost="
+
+        async with self.session.post(
+            f"{BASE_URL}{ENDPOINTS['plant_list']}",
+            data=plant_list_data,
+            headers=HEADERS,
+        ) as resp:
+            if resp.status != 200:
+                raise UpdateFailed(f"Failed to get plant list: {resp.status}")
+            plant_info = await resp.json()
+
+            if not plant_info.get("plantList"):
+                raise UpdateFailed("No plants found")
+
+            # Use the first plant if plant_id is not set
+            if self._plant_id is None:
+                self._plant_id = 0
+
+            plant = plant_info["plantList"][self._plant_id]
+            plant_uid = plant["plantuid"]
+
+        # Get plant details
+        plant_detail_data = f"plantuid={plant_uid}&clientDate={client_date}"
+        async with self.session.post(
+            f"{BASE_URL}{ENDPOINTS['plant_detail']}",
+            data=plant_detail_data,
+            headers=HEADERS,
+        ) as resp:
+            if resp.status != 200:
+                raise UpdateFailed(f"Failed to get plant details: {resp.status}")
+            plant_details = await resp.json()
+
+        device_sn = plant_details["plantDetail"]["snList"][0]
+        self.plant_uid = plant_uid
+        self.device_sn = device_sn
+
+        device_power = await self._async_fetch_device_power(device_sn)
+
+        # Get plant chart data for historical information, only once in a
+        # while since the energy counters are integrated locally in between
+        now = dt_util.now()
+        if (
+            self._force_full_refresh
+            or self.data is None
+            or self._chart_fetched_at is None
+            or self._chart_fetched_at.date() != now.date()
+            or now - self._chart_fetched_at >= timedelta(seconds=CHART_UPDATE_INTERVAL)
+        ):
+            chart_data = await self.async_fetch_chart(self.session, plant_uid, device_sn, now)
+            self._chart_fetched_at = now
+            # PV generation is reconciled with the plant detail instead, as the
+            # chart viewBean has no confirmed generation total
+            self.energy.reconcile(
+                now,
+                {
+                    **(chart_data.get("viewBean") or {}),
+                    "todayElectricity": plant_details["plantDetail"].get("todayElectricity"),
+                },
+            )
+        else:
+            chart_data = self.data["chart_data"]
+
+        battery_data, battery_stats = await self._async_fetch_battery(device_sn)
+
+        # Combine all data
+        data = {
+            "plant_info": plant_info,
+            "plant_details": plant_details,
+            "device_power": device_power,
+            "chart_data": chart_data,
+            "battery_info": battery_data,
+            "battery_stats": battery_stats,
+            "energy": self.energy.as_dict(),
+            "burst": self._burst_data(),
+        }
+
+        await self.async_logout(self.session)
+        return data
+
+    async def _async_update_realtime_data(self) -> dict[str, Any]:
+        """Fetch only the real-time endpoints, reusing the rest of the last data."""
+        device_sn = self.device_sn
+        self._use_burst_budget(BURST_REQUESTS_PER_POLL)
+
+        await self.async_login(self.session)
+        device_power = await self._async_fetch_device_power(device_sn)
+        battery_data, battery_stats = await self._async_fetch_battery(device_sn)
+        await self.async_logout(self.session)
+
+        return {
+            **self.data,
+            "device_power": device_power,
+            "battery_info": battery_data,
+            "battery_stats": battery_stats,
+            "energy": self.energy.as_dict(),
+            "burst": self._burst_data(),
+        }
+
+    def _burst_data(self) -> dict[str, Any]:
+        """Return the burst state exposed to sensors."""
+        return {
+            "active": self.burst_active,
+            "budget_remaining": self.burst_budget_remaining,
+        }
+
+    async def async_login(self, session: aiohttp.ClientSession) -> None:
+        """Log in to the portal."""
+        login_data = {
+            "lang": "en",
+            "username": self.username,
+            "password": self.password,
+            "rememberMe": "true",
+        }
+
+        async with session.post(
+            f"{BASE_URL}{ENDPOINTS['login']}",
+            data=login_data,
+            headers=HEADERS,
+        ) as resp:
+            if resp.status == 401:
+                raise ConfigEntryAuthFailed("Invalid authentication")
+            if resp.status != 200:
+                raise UpdateFailed(f"Login failed with status {resp.status}")
+
+    async def async_logout(self, session: aiohttp.ClientSession) -> None:
+        """Logout and clear session."""
+        async with session.post(f"{BASE_URL}/logout", headers=HEADERS):
+            pass
+
+    async def async_fetch_chart(
+        self,
+        session: aiohttp.ClientSession,
+        plant_uid: str,
+        device_sn: str,
+        day: date,
+    ) -> dict[str, Any]:
+        """Get the plant chart data of a single day."""
+        now = dt_util.now()
+        client_date = now.strftime("%Y-%m-%d")
+        epoch_ms = int(now.timestamp() * 1000)
+        chart_day = day.strftime("%Y-%m-%d")
+        previous_day = (day - timedelta(days=1)).strftime("%Y-%m-%d")
+        next_day = (day + timedelta(days=1)).strftime("%Y-%m-%d")
+        current_month = day.strftime("%Y-%m")
+        previous_month = (day.replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+        next_month = (day.replace(day=28) + timedelta(days=4)).strftime("%Y-%m")
+        current_year = day.strftime("%Y")
+        previous_year = str(int(current_year) - 1)
+        next_year = str(int(current_year) + 1)
+
+        chart_url = (
+            f"{BASE_URL}{ENDPOINTS['plant_chart']}?"
+            f"plantuid={plant_uid}&"
+            f"chartDateType=1&"
+            f"energyType=0&"
+            f"clientDate={client_date}&"
+            f"deviceSnArr={device_sn}&"
+            f"chartCountType=2&"
+            f"previousChartDay={previous_day}&"
+            f"nextChartDay={next_day}&"
+            f"chartDay={chart_day}&"
+            f"previousChartMonth={previous_month}&"
+            f"nextChartMonth={next_month}&"
+            f"chartMonth={current_month}&"
+            f"previousChartYear={previous_year}&"
+            f"nextChartYear={next_year}&"
+            f"chartYear={current_year}&"
+            f"elecDevicesn={device_sn}&"
+            f"_={epoch_ms}"
+        )
+
+        async with session.get(
+            chart_url,
+            headers=HEADERS,
+        ) as resp:
+            if resp.status != 200:
+                raise UpdateFailed(f"Failed to get plant chart data: {resp.status}")
+            return await resp.json()
+
+    async def _async_fetch_device_power(self, device_sn: str) -> dict[str, Any]:
+        """Get device power info (specific to H1) and integrate it into energy."""
+        epoch_ms = int(dt_util.now().timestamp() * 1000)
+
+        async with self.session.post(
+            f"{BASE_URL}{ENDPOINTS['device_power']}?plantuid=&devicesn={device_sn}&_={epoch_ms}",
+            headers=HEADERS,
+        ) as resp:
+            if resp.status != 200:
+                raise UpdateFailed(f"Failed to get device power info: {resp.status}")
+            device_power = await resp.json()
+
+        try:
+            flows = realtime_flows(device_power["storeDevicePower"])
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.debug("No real-time power to integrate")
+        else:
+            self.energy.update(dt_util.now(), flows)
+
+        return device_power
+
+    async def _async_fetch_battery(self, device_sn: str) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Get battery real-time information and update the battery series."""
+        current_time = dt_util.now().strftime("%Y-%m-%d %H:%M:00")
+        battery_data = f"devicesn={device_sn}&timeStr={current_time}"
+
+        async with self.session.post(
+            f"{BASE_URL}{ENDPOINTS['battery_info']}",
+            data=battery_data,
+            headers=HEADERS,
+        ) as resp:
+            if resp.status != 200:
+                raise UpdateFailed(f"Failed to get battery info: {resp.status}")
+            battery_info = await resp.json()
+
+            # The first array is the minute-level series, most recent sample first
+            if battery_info.get("result") == "OK" and battery_info.get("list"):
+                battery_samples = battery_info["list"][0] or []
+            else:
+                battery_samples = []
+            battery_data = battery_samples[0] if battery_samples else {}
+
+        # Keep the whole series rather than only the latest sample
+        parsed_samples = parse_battery_samples(battery_samples)
+        if battery_samples and not parsed_samples and not self._battery_time_warned:
+            self._battery_time_warned = True
+            _LOGGER.warning(
+                "No battery sample has a time in any of %s, sample keys are %s",
+                BATTERY_TIME_KEYS,
+                sorted(battery_samples[0]),
+            )
+        self.battery_series.merge(parsed_samples)
+        battery_stats = {}
+        if (newest := self.battery_series.newest) is not None:
+            battery_stats = {
+                field: self.battery_series.stats(field, newest - BATTERY_STATS_WINDOW)
+                for field in BATTERY_SERIES_FIELDS
+            }
+        # A recorder problem must not make every sensor unavailable
+        try:
+            self._battery_imported_hour = await async_import_battery_statistics(
+                self.hass, self.battery_series, self._battery_imported_hour
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to import battery statistics")
+
+        return battery_data, battery_stats
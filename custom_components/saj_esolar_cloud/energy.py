@@ -0,0 +1,90 @@
+"""Local energy estimation for the SAJ eSolar integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from .const import ENERGY_COUNTERS, ENERGY_MAX_GAP
+
+
+def realtime_flows(store_device_power: dict[str, Any]) -> dict[str, float]:
+    """Split the real-time powers into non-negative flows in W, per counter."""
+    grid = float(store_device_power["gridPower"])
+    battery = float(store_device_power["batteryPower"])
+    grid_direction = int(store_device_power["gridDirection"])
+    battery_direction = int(store_device_power["batteryDirection"])
+
+    return {
+        # Grid direction 1 is exporting, battery direction -1 is charging
+        "gridImport": 0.0 if grid_direction == 1 else grid,
+        "gridExport": grid if grid_direction == 1 else 0.0,
+        "batteryCharge": battery if battery_direction == -1 else 0.0,
+        "batteryDischarge": 0.0 if battery_direction == -1 else battery,
+        "pvGeneration": float(store_device_power["pvPower"]),
+        "consumption": float(store_device_power["totalLoadPower"]),
+    }
+
+
+class EnergyIntegrator:
+    """Integrate real-time power into daily energy counters.
+
+    Counters are kept in kWh, reset at midnight and only ever increase during
+    a day. When the chart totals are lower than the local estimate the
+    difference is absorbed by the next integrated energy instead of making
+    the counter go down.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self._day: datetime | None = None
+        self._last_time: datetime | None = None
+        self._last_flows: dict[str, float] = {}
+        self._values = {key: 0.0 for key in ENERGY_COUNTERS}
+        self._excess = {key: 0.0 for key in ENERGY_COUNTERS}
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the counters rounded to Wh."""
+        return {key: round(value, 3) for key, value in self._values.items()}
+
+    def update(self, now: datetime, flows: dict[str, float]) -> None:
+        """Add the energy since the previous sample using the trapezoidal rule."""
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        last_time, last_flows = self._last_time, self._last_flows
+        self._last_time, self._last_flows = now, flows
+
+        if self._day != midnight:
+            self._day = midnight
+            self._reset()
+
+        if last_time is None or not timedelta(0) < now - last_time <= timedelta(seconds=ENERGY_MAX_GAP):
+            return
+
+        # Only the part of an interval spanning midnight after it counts today
+        hours = (now - max(last_time, midnight)).total_seconds() / 3600
+        for key, power in flows.items():
+            energy = (last_flows.get(key, power) + power) / 2 * hours / 1000
+            absorbed = min(self._excess[key], energy)
+            self._excess[key] -= absorbed
+            self._values[key] += energy - absorbed
+
+    def reconcile(self, now: datetime, totals: dict[str, Any]) -> None:
+        """Correct the counters with today's chart totals."""
+        if self._day != now.replace(hour=0, minute=0, second=0, microsecond=0):
+            return
+
+        for key, chart_key in ENERGY_COUNTERS.items():
+            try:
+                total = float(totals[chart_key])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if total >= self._values[key]:
+                self._values[key] = total
+                self._excess[key] = 0.0
+            else:
+                self._excess[key] = self._values[key] - total
+
+    def _reset(self) -> None:
+        """Reset the counters for a new day."""
+        for key in ENERGY_COUNTERS:
+            self._values[key] = 0.0
+            self._excess[key] = 0.0
@@ -0,0 +1,207 @@
+"""Streaming export of historical plant data for the SAJ eSolar integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import suppress
+import csv
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from itertools import islice
+import logging
+import os
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    DOMAIN,
+    EXPORT_DAY_FIELDS,
+    EXPORT_MAX_CONCURRENCY,
+    EXPORT_REQUESTS_PER_SECOND,
+    EXPORT_SLOT_MINUTES,
+    EXPORT_SLOT_SERIES,
+)
+from .coordinator import SAJeSolarDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SLOTS_PER_DAY = 24 * 60 // EXPORT_SLOT_MINUTES
+
+
+class RateLimiter:
+    """Limit the number of concurrent requests and the rate they start at."""
+
+    def __init__(self, concurrency: int, rate: float) -> None:
+        """Initialize the limiter."""
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._interval = 1 / rate
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run func once a slot is free and the rate allows it."""
+        async with self._semaphore:
+            async with self._lock:
+                now = asyncio.get_running_loop().time()
+                delay = self._next_start - now
+                self._next_start = max(now, self._next_start) + self._interval
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return await func(*args)
+
+
+async def async_stream_days(
+    days: Iterable[date],
+    fetch: Callable[[date], Awaitable[dict[str, Any]]],
+    limiter: RateLimiter,
+    window: int,
+) -> AsyncIterator[tuple[date, dict[str, Any]]]:
+    """Fetch days concurrently and yield them in order.
+
+    Only window days are requested at a time, so at most that many responses
+    are held in memory regardless of the length of the range. When one fetch
+    fails the others of its window are cancelled.
+    """
+    days = iter(days)
+    while chunk := list(islice(days, window)):
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(limiter.run(fetch, day)) for day in chunk]
+        except ExceptionGroup as err:
+            # Callers handle the original error, not the group
+            raise err.exceptions[0] from err
+        for day, task in zip(chunk, tasks):
+            yield day, task.result()
+
+
+def day_row(day: date, chart: dict[str, Any]) -> list[Any]:
+    """Return the daily totals row of a chart response."""
+    view_bean = chart.get("viewBean") or {}
+    return [day.isoformat(), *(view_bean.get(field, "") for field in EXPORT_DAY_FIELDS)]
+
+
+def slot_rows(day: date, chart: dict[str, Any]) -> list[list[Any]] | None:
+    """Return one row per 5 minute slot of a chart response.
+
+    The time of a slot follows from its index, counted from midnight. Returns
+    None when the response has none of the series or more values than slots.
+    """
+    series = [
+        values if isinstance(values := chart.get(key), list) else []
+        for key in EXPORT_SLOT_SERIES
+    ]
+    num_slots = max(map(len, series))
+    if not num_slots or num_slots > SLOTS_PER_DAY:
+        return None
+
+    midnight = datetime.combine(day, time.min)
+    return [
+        [
+            (midnight + timedelta(minutes=EXPORT_SLOT_MINUTES * index)).strftime("%Y-%m-%d %H:%M"),
+            *(values[index] if index < len(values) else "" for values in series),
+        ]
+        for index in range(num_slots)
+    ]
+
+
+def _finish_export(part_path: str, path: str, completed: bool) -> None:
+    """Move a complete export into place, or remove an incomplete one."""
+    if completed:
+        os.replace(part_path, path)
+    else:
+        with suppress(FileNotFoundError):
+            os.remove(part_path)
+
+
+async def async_export_history(
+    hass: HomeAssistant,
+    coordinator: SAJeSolarDataUpdateCoordinator,
+    start: date,
+    end: date,
+    granularity: str,
+) -> dict[str, Any]:
+    """Stream the plant chart history between start and end to a CSV file.
+
+    Rows go to a .part file that only replaces the export once every day has
+    been written, so a failed export never leaves a partial file behind.
+    """
+    plant_uid, device_sn = coordinator.plant_uid, coordinator.device_sn
+    if plant_uid is None or device_sn is None:
+        raise HomeAssistantError("Plant data has not been loaded yet")
+    if end < start:
+        raise HomeAssistantError("End date must not be before start date")
+
+    path = hass.config.path(f"{DOMAIN}_export_{plant_uid}_{start}_{end}_{granularity}.csv")
+    part_path = f"{path}.part"
+    num_days = (end - start).days + 1
+    days = (start + timedelta(days=offset) for offset in range(num_days))
+
+    # A separate session so logging out does not end the coordinator's session
+    session = async_create_clientsession(hass, auto_cleanup=False)
+    limiter = RateLimiter(EXPORT_MAX_CONCURRENCY, EXPORT_REQUESTS_PER_SECOND)
+    export_file = await hass.async_add_executor_job(
+        partial(open, part_path, "w", newline="", encoding="utf-8")
+    )
+    writer = csv.writer(export_file)
+    rows_written = 0
+    skipped_days = 0
+    first_skipped: tuple[date, list[str]] | None = None
+    completed = False
+
+    async def async_fetch(day: date) -> dict[str, Any]:
+        return await coordinator.async_fetch_chart(session, plant_uid, device_sn, day)
+
+    try:
+        await coordinator.async_login(session)
+        if granularity == "day":
+            header = ["date", *EXPORT_DAY_FIELDS]
+        else:
+            header = ["time", *EXPORT_SLOT_SERIES]
+        await hass.async_add_executor_job(writer.writerow, header)
+
+        async for day, chart in async_stream_days(
+            days, async_fetch, limiter, EXPORT_MAX_CONCURRENCY * 2
+        ):
+            if granularity == "day":
+                rows = [day_row(day, chart)]
+            elif (rows := slot_rows(day, chart)) is None:
+                if first_skipped is None:
+                    first_skipped = (day, sorted(chart))
+                skipped_days += 1
+                continue
+            await hass.async_add_executor_job(writer.writerows, rows)
+            rows_written += len(rows)
+        completed = True
+
+        try:
+            await coordinator.async_logout(session)
+        except aiohttp.ClientError as err:
+            _LOGGER.debug("Failed to log out after export: %s", err)
+    except (aiohttp.ClientError, UpdateFailed, ValueError) as err:
+        # ValueError covers a response body that is not valid JSON
+        raise HomeAssistantError(f"Failed to export history: {err}") from err
+    finally:
+        await hass.async_add_executor_job(export_file.close)
+        await session.close()
+        await hass.async_add_executor_job(_finish_export, part_path, path, completed)
+
+    if first_skipped is not None:
+        _LOGGER.warning(
+            "Skipped %d of %d days without the expected %s series, keys of %s are %s",
+            skipped_days,
+            num_days,
+            EXPORT_SLOT_SERIES,
+            *first_skipped,
+        )
+    _LOGGER.info("Exported %d rows for %d days to %s", rows_written, num_days, path)
+    return {
+        "path": path,
+        "days": num_days,
+        "rows": rows_written,
+        "skipped_days": skipped_days,
+    }
@@ -0,0 +1,122 @@
+"""On-demand profiling of a SAJ eSolar coordinator refresh.
+
+This module is only imported when the profile_refresh service is called, so
+cProfile and tracemalloc are never loaded during normal operation.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import re
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, PROFILE_TOP_ALLOCATIONS, PROFILE_TOP_FUNCTIONS
+from .coordinator import SAJeSolarDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frames from the profiling machinery itself are not interesting
+_ALLOCATION_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+# The profiler stays enabled across every await, so the event loop and the
+# selector dominate the raw profile; the summary only keeps our own frames
+_FUNCTION_FILTER = re.compile(r"saj_esolar_cloud|aiohttp|homeassistant[/\\]helpers")
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant,
+    coordinator: SAJeSolarDataUpdateCoordinator,
+) -> dict[str, Any]:
+    """Run one full refresh under cProfile and tracemalloc."""
+    stamp = dt_util.now().strftime("%Y%m%d_%H%M%S")
+    profile_path = hass.config.path(f"{DOMAIN}_profile_{stamp}.prof")
+    report_path = hass.config.path(f"{DOMAIN}_report_{stamp}.txt")
+
+    # Leave tracemalloc alone if someone else already started it
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        # Covers every endpoint, even during a burst, and the listener fan-out
+        await coordinator.async_full_refresh()
+    finally:
+        profiler.disable()
+        elapsed = time.perf_counter() - start
+        snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+
+    top_functions, top_allocations = await hass.async_add_executor_job(
+        _write_results, profiler, snapshot, profile_path, report_path
+    )
+    _LOGGER.info("Profiled refresh in %.3fs, written to %s", elapsed, profile_path)
+
+    return {
+        "duration_s": round(elapsed, 3),
+        "success": coordinator.last_update_success,
+        "profile_path": profile_path,
+        "report_path": report_path,
+        "top_functions": top_functions,
+        "top_allocations": top_allocations,
+    }
+
+
+def _write_results(
+    profiler: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot,
+    profile_path: str,
+    report_path: str,
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """Write the profile and the text report, returning a summary of both."""
+    profiler.dump_stats(profile_path)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+        _FUNCTION_FILTER.pattern, PROFILE_TOP_FUNCTIONS
+    )
+    functions = [
+        (func, calls, cumtime)
+        for func, (_, calls, _, cumtime, _) in stats.stats.items()
+        if _FUNCTION_FILTER.search(pstats.func_std_string(func))
+    ]
+    functions.sort(key=lambda item: item[2], reverse=True)
+    top_functions = [
+        f"{pstats.func_std_string(func)} calls={calls} cumtime={cumtime:.4f}s"
+        for func, calls, cumtime in functions[:PROFILE_TOP_FUNCTIONS]
+    ]
+
+    allocations = snapshot.filter_traces(_ALLOCATION_FILTERS).statistics("lineno")
+    top_allocations = [
+        {
+            "site": str(stat.traceback),
+            "size_kib": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in allocations[:PROFILE_TOP_ALLOCATIONS]
+    ]
+
+    with open(report_path, "w", encoding="utf-8") as report:
+        report.write("Slowest functions\n")
+        report.write(stream.getvalue())
+        report.write("\nTop allocation sites\n")
+        for stat in allocations[:PROFILE_TOP_ALLOCATIONS]:
+            report.write(f"{stat}\n")
+
+    return top_functions, top_allocations
@@ -0,0 +1,68 @@
+"""Local MQTT fan-out of SAJ eSolar coordinator snapshots."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_dumps
+
+from .const import H1_SENSORS
+from .coordinator import SAJeSolarDataUpdateCoordinator
+from .sensor import get_sensor_value
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SAJeSolarMqttPublisher:
+    """Publish one retained, compact message per device on every change.
+
+    Publishing goes through the Home Assistant MQTT integration in a
+    background task, so the refresh path never waits on the broker.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: SAJeSolarDataUpdateCoordinator,
+        topic: str,
+    ) -> None:
+        """Initialize the publisher."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.topic = topic
+        self._last_payloads: dict[str, str] = {}
+
+    @callback
+    def async_handle_update(self) -> None:
+        """Schedule publishing of the new snapshot if it changed."""
+        data = self.coordinator.data
+        device_sn = self.coordinator.device_sn
+        if not self.coordinator.last_update_success or data is None or device_sn is None:
+            return
+
+        snapshot = {key: get_sensor_value(data, key) for key in H1_SENSORS}
+        payload = json_dumps(snapshot)
+        if self._last_payloads.get(device_sn) == payload:
+            return
+
+        self._last_payloads[device_sn] = payload
+        self.hass.async_create_background_task(
+            self._async_publish(device_sn, payload),
+            f"saj_esolar_cloud mqtt publish {device_sn}",
+        )
+
+    async def _async_publish(self, device_sn: str, payload: str) -> None:
+        """Publish a snapshot to the MQTT broker."""
+        # Imported here so MQTT stays optional for users without a broker
+        from homeassistant.components import mqtt
+
+        topic = self.topic.format(device_sn=device_sn)
+        try:
+            if not await mqtt.async_wait_for_mqtt_client(self.hass):
+                raise RuntimeError("MQTT integration is not available")
+            await mqtt.async_publish(self.hass, topic, payload, qos=0, retain=True)
+        except Exception as err:  # noqa: BLE001
+            # Forget the payload so the next refresh tries again
+            if self._last_payloads.get(device_sn) == payload:
+                self._last_payloads.pop(device_sn)
+            _LOGGER.warning("Failed to publish snapshot to %s: %s", topic, err)
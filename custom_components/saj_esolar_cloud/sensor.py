@@ -24,7 +24,15 @@ from homeassistant.helpers.update_coordinator import (
 )
 from homeassistant.util import dt as dt_util
 
-from .const import DEVICE_INFO, DIRECTION_STATES, BATTERY_STATES, DOMAIN, H1_SENSORS
+from .const import (
+    BATTERY_SERIES_FIELDS,
+    BATTERY_STATES,
+    DEVICE_INFO,
+    DIRECTION_STATES,
+    DOMAIN,
+    ENERGY_COUNTERS,
+    H1_SENSORS,
+)
 from .coordinator import SAJeSolarDataUpdateCoordinator
 
 # Device class mapping
@@ -44,6 +52,18 @@ STATE_CLASS_MAP = {
     "total": SensorStateClass.TOTAL,
 }
 
+# Battery statistics sensor mapping, e.g. batVoltageMin -> (batVoltage, min)
+BATTERY_STAT_SENSORS = {
+    f"{field}{stat.capitalize()}": (field, stat)
+    for field in BATTERY_SERIES_FIELDS
+    for stat in ("min", "max", "mean")
+}
+
+# Estimated energy sensor mapping, e.g. estimatedGridImport -> gridImport
+ESTIMATED_ENERGY_SENSORS = {
+    f"estimated{key[0].upper()}{key[1:]}": key for key in ENERGY_COUNTERS
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -69,6 +89,98 @@ async def async_setup_entry(
 
     async_add_entities(entities)
 
+def get_sensor_value(data: dict[str, Any], sensor_key: str) -> StateType:
+    """Return the normalized value of a sensor key from coordinator data."""
+    try:
+        # Plant Detail Sensors
+        if sensor_key in [
+            "nowPower", "todayElectricity", "monthElectricity",
+            "yearElectricity", "totalElectricity", "totalConsumpElec",
+            "totalBuyElec", "totalSellElec", "totalPlantTreeNum",
+            "totalReduceCo2"
+        ]:
+            return float(data["plant_details"]["plantDetail"][sensor_key])
+        elif sensor_key == "lastUploadTime":
+            # Parse the timestamp string to datetime object with timezone
+            timestamp = data["plant_details"]["plantDetail"]["lastUploadTime"]
+            naive_dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+            # Return the datetime object directly, not its string representation
+            return dt_util.as_utc(naive_dt)
+        elif sensor_key == "selfUseRate":
+            # Remove % symbol and convert to float
+            value = data["plant_details"]["plantDetail"]["selfUseRate"]
+            return float(value.rstrip("%"))
+
+        # Device Power Sensors
+        elif sensor_key in [
+            "pvPower", "outPower", "totalLoadPower", "batCurr",
+            "batEnergyPercent", "batCapcity"
+        ]:
+            return float(data["device_power"]["storeDevicePower"][sensor_key])
+        elif sensor_key == "gridPower":
+            power = float(data["device_power"]["storeDevicePower"]["gridPower"])
+            direction = int(data["device_power"]["storeDevicePower"]["gridDirection"])
+            # Make power negative when exporting (direction = 1)
+            return -power if direction == 1 else power
+        elif sensor_key == "gridPowerAbsolute":
+            return float(data["device_power"]["storeDevicePower"]["gridPower"])
+        elif sensor_key == "batteryPower":
+            power = float(data["device_power"]["storeDevicePower"]["batteryPower"])
+            direction = int(data["device_power"]["storeDevicePower"]["batteryDirection"])
+            # Make power negative when charging (direction = -1)
+            return -power if direction == -1 else power
+        elif sensor_key == "batteryPowerAbsolute":
+            return float(data["device_power"]["storeDevicePower"]["batteryPower"])
+
+        # Daily Values from Chart Data
+        elif sensor_key == "dailyConsumption":
+            return float(data["chart_data"]["viewBean"]["useElec"])
+        elif sensor_key == "dailyGridImport":
+            return float(data["chart_data"]["viewBean"]["buyElec"])
+        elif sensor_key == "dailyGridExport":
+            return float(data["chart_data"]["viewBean"]["sellElec"])
+        elif sensor_key == "dailyBatteryCharge":
+            return float(data["chart_data"]["viewBean"]["chargeElec"])
+        elif sensor_key == "dailyBatteryDischarge":
+            return float(data["chart_data"]["viewBean"]["dischargeElec"])
+        elif sensor_key == "dailyTreesPlanted":
+            return float(data["chart_data"]["viewBean"]["plantTreeNum"])
+        elif sensor_key == "dailyReduceCo2":
+            return float(data["chart_data"]["viewBean"]["reduceCo2"])
+
+        # Daily Values integrated locally from real-time power
+        elif sensor_key in ESTIMATED_ENERGY_SENSORS:
+            return data["energy"][ESTIMATED_ENERGY_SENSORS[sensor_key]]
+
+        # Battery Info Sensors
+        elif sensor_key in ["batVoltage", "batTemperature"]:
+            return float(data["battery_info"][sensor_key])
+        elif sensor_key in BATTERY_STAT_SENSORS:
+            # Statistics over the buffered minute-level battery series
+            field, stat = BATTERY_STAT_SENSORS[sensor_key]
+            return data["battery_stats"][field][stat]
+
+        # Direction Sensors
+        elif sensor_key in ["pvDirection", "gridDirection", "outPutDirection"]:
+            value = int(data["device_power"]["storeDevicePower"][sensor_key])
+            return DIRECTION_STATES.get(value, f"Unknown ({value})")
+        elif sensor_key == "batteryDirection":
+            value = int(data["device_power"]["storeDevicePower"][sensor_key])
+            return BATTERY_STATES.get(value, f"Unknown ({value})")
+
+        # Online Status
+        elif sensor_key == "isOnline":
+            value = int(data["device_power"]["storeDevicePower"]["isOnline"])
+            return "Yes" if value else "No"
+
+        # Integration Sensors
+        elif sensor_key == "burstBudgetRemaining":
+            return int(data["burst"]["budget_remaining"])
+
+        return None
+    except (KeyError, TypeError, ValueError):
+        return None
+
 class SAJeSolarSensor(CoordinatorEntity[SAJeSolarDataUpdateCoordinator], SensorEntity):
     """Representation of a SAJ eSolar sensor."""
 
@@ -105,85 +217,7 @@ class SAJeSolarSensor(CoordinatorEntity[SAJeSolarDataUpdateCoordinator], SensorE
     @property
     def native_value(self) -> StateType:
         """Return the sensor value."""
-        try:
-            data = self.coordinator.data
-
-            # Plant Detail Sensors
-            if self._sensor_key in [
-                "nowPower", "todayElectricity", "monthElectricity",
-                "yearElectricity", "totalElectricity", "totalConsumpElec",
-                "totalBuyElec", "totalSellElec", "totalPlantTreeNum",
-                "totalReduceCo2"
-            ]:
-                return float(data["plant_details"]["plantDetail"][self._sensor_key])
-            elif self._sensor_key == "lastUploadTime":
-                # Parse the timestamp string to datetime object with timezone
-                timestamp = data["plant_details"]["plantDetail"]["lastUploadTime"]
-                naive_dt = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                # Return the datetime object directly, not its string representation
-                return dt_util.as_utc(naive_dt)
-            elif self._sensor_key == "selfUseRate":
-                # Remove % symbol and convert to float
-                value = data["plant_details"]["plantDetail"]["selfUseRate"]
-                return float(value.rstrip("%"))
-
-            # Device Power Sensors
-            elif self._sensor_key in [
-                "pvPower", "outPower", "totalLoadPower", "batCurr",
-                "batEnergyPercent", "batCapcity"
-            ]:
-                return float(data["device_power"]["storeDevicePower"][self._sensor_key])
-            elif self._sensor_key == "gridPower":
-                power = float(data["device_power"]["storeDevicePower"]["gridPower"])
-                direction = int(data["device_power"]["storeDevicePower"]["gridDirection"])
-                # Make power negative when exporting (direction = 1)
-                return -power if direction == 1 else power
-            elif self._sensor_key == "gridPowerAbsolute":
-                return float(data["device_power"]["storeDevicePower"]["gridPower"])
-            elif self._sensor_key == "batteryPower":
-                power = float(data["device_power"]["storeDevicePower"]["batteryPower"])
-                direction = int(data["device_power"]["storeDevicePower"]["batteryDirection"])
-                # Make power negative when charging (direction = -1)
-                return -power if direction == -1 else power
-            elif self._sensor_key == "batteryPowerAbsolute":
-                return float(data["device_power"]["storeDevicePower"]["batteryPower"])
-
-            # Daily Values from Chart Data
-            elif self._sensor_key == "dailyConsumption":
-                return float(data["chart_data"]["viewBean"]["useElec"])
-            elif self._sensor_key == "dailyGridImport":
-                return float(data["chart_data"]["viewBean"]["buyElec"])
-            elif self._sensor_key == "dailyGridExport":
-                return float(data["chart_data"]["viewBean"]["sellElec"])
-            elif self._sensor_key == "dailyBatteryCharge":
-                return float(data["chart_data"]["viewBean"]["chargeElec"])
-            elif self._sensor_key == "dailyBatteryDischarge":
-                return float(data["chart_data"]["viewBean"]["dischargeElec"])
-            elif self._sensor_key == "dailyTreesPlanted":
-                return float(data["chart_data"]["viewBean"]["plantTreeNum"])
-            elif self._sensor_key == "dailyReduceCo2":
-                return float(data["chart_data"]["viewBean"]["reduceCo2"])
-
-            # Battery Info Sensors
-            elif self._sensor_key in ["batVoltage", "batTemperature"]:
-                return float(data["battery_info"][self._sensor_key])
-
-            # Direction Sensors
-            elif self._sensor_key in ["pvDirection", "gridDirection", "outPutDirection"]:
-                value = int(data["device_power"]["storeDevicePower"][self._sensor_key])
-                return DIRECTION_STATES.get(value, f"Unknown ({value})")
-            elif self._sensor_key == "batteryDirection":
-                value = int(data["device_power"]["storeDevicePower"][self._sensor_key])
-                return BATTERY_STATES.get(value, f"Unknown ({value})")
-
-            # Online Status
-            elif self._sensor_key == "isOnline":
-                value = int(data["device_power"]["storeDevicePower"]["isOnline"])
-                return "Yes" if value else "No"
-
-            return None
-        except (KeyError, TypeError, ValueError):
-            return None
+        return get_sensor_value(self.coordinator.data, self._sensor_key)
 
     @property
     def available(self) -> bool:
@@ -191,6 +225,10 @@ class SAJeSolarSensor(CoordinatorEntity[SAJeSolarDataUpdateCoordinator], SensorE
         if self.coordinator.data is None:
             return False
 
+        # Integration sensors do not depend on the inverter being online
+        if self._sensor_key == "burstBudgetRemaining":
+            return True
+
         try:
             # Check if device is online
             online = self.coordinator.data["device_power"]["storeDevicePower"]["isOnline"]
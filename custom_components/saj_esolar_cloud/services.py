@@ -0,0 +1,130 @@
+"""Services for the SAJ eSolar integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    BURST_DEFAULT_INTERVAL,
+    BURST_MAX_DURATION,
+    BURST_MIN_INTERVAL,
+    DOMAIN,
+    EXPORT_GRANULARITIES,
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_START_BURST,
+    UPDATE_INTERVAL,
+)
+
+SERVICES = [SERVICE_PROFILE_REFRESH, SERVICE_START_BURST, SERVICE_EXPORT_HISTORY]
+
+START_BURST_SCHEMA = vol.Schema(
+    {
+        vol.Required("duration"): vol.All(
+            cv.time_period,
+            vol.Range(min=timedelta(seconds=1), max=timedelta(seconds=BURST_MAX_DURATION)),
+        ),
+        vol.Optional("interval", default=timedelta(seconds=BURST_DEFAULT_INTERVAL)): vol.All(
+            cv.time_period,
+            vol.Range(
+                min=timedelta(seconds=BURST_MIN_INTERVAL),
+                max=timedelta(seconds=UPDATE_INTERVAL - 1),
+            ),
+        ),
+    }
+)
+
+EXPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("start_date"): cv.date,
+        vol.Required("end_date"): cv.date,
+        vol.Optional("granularity", default="day"): vol.In(EXPORT_GRANULARITIES),
+    }
+)
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH):
+        return
+
+    async def async_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        """Profile one refresh of every configured coordinator."""
+        # Imported here so the profiling machinery is only loaded on demand
+        from .profiling import async_profile_refresh as _async_profile_refresh
+
+        return {
+            entry_id: await _async_profile_refresh(hass, coordinator)
+            for entry_id, coordinator in hass.data[DOMAIN].items()
+        }
+
+    async def async_start_burst(call: ServiceCall) -> None:
+        """Temporarily poll the real-time endpoints at a faster interval."""
+        # One exhausted budget must not keep the other entries from bursting
+        exhausted = []
+        for entry_id, coordinator in hass.data[DOMAIN].items():
+            try:
+                await coordinator.async_start_burst(
+                    call.data["duration"], call.data["interval"]
+                )
+            except HomeAssistantError:
+                exhausted.append(entry_id)
+
+        if exhausted:
+            raise HomeAssistantError(
+                f"Daily burst request budget exhausted for {', '.join(exhausted)}"
+            )
+
+    async def async_export_history(call: ServiceCall) -> ServiceResponse:
+        """Export the plant history of every configured coordinator."""
+        # Imported here so the exporter is only loaded on demand
+        from .exporter import async_export_history as _async_export_history
+
+        return {
+            entry_id: await _async_export_history(
+                hass,
+                coordinator,
+                call.data["start_date"],
+                call.data["end_date"],
+                call.data["granularity"],
+            )
+            for entry_id, coordinator in hass.data[DOMAIN].items()
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_profile_refresh,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_BURST,
+        async_start_burst,
+        schema=START_BURST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        async_export_history,
+        schema=EXPORT_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the integration services once the last entry is unloaded."""
+    if hass.data.get(DOMAIN):
+        return
+
+    for service in SERVICES:
+        hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1 @@
+"""Tests for the SAJ eSolar Cloud integration."""
@@ -0,0 +1,146 @@
+"""Tests for the SAJ eSolar battery series and statistics import."""
+from datetime import datetime, timedelta
+import logging
+import math
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.saj_esolar_cloud.battery import (
+    BatterySeries,
+    async_import_battery_statistics,
+    parse_battery_samples,
+)
+from custom_components.saj_esolar_cloud.coordinator import SAJeSolarDataUpdateCoordinator
+
+ADD_STATISTICS = "homeassistant.components.recorder.statistics.async_add_external_statistics"
+
+
+def _samples(start: datetime, minutes: int) -> list[tuple[float, dict[str, Any]]]:
+    """Return minute samples whose voltage is the UTC hour they fall in."""
+    samples = []
+    for minute in range(minutes):
+        moment = start + timedelta(minutes=minute)
+        hour = dt_util.as_utc(moment).hour
+        samples.append((moment.timestamp(), {"batVoltage": hour, "batTemperature": 20}))
+    return samples
+
+
+def _local_samples(start: datetime, minutes: int) -> list[tuple[float, dict[str, Any]]]:
+    """Return the same samples as the portal reports them, in local time."""
+    return parse_battery_samples(
+        {**sample, "dataTime": dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).strftime("%Y-%m-%d %H:%M:%S")}
+        for timestamp, sample in _samples(start, minutes)
+    )
+
+
+async def _async_import(hass: HomeAssistant, series: BatterySeries, since: datetime | None) -> tuple[datetime | None, list[datetime]]:
+    """Import statistics and return the last imported hour and the voltage hours."""
+    hass.config.components.add("recorder")
+    with patch(ADD_STATISTICS) as add_statistics:
+        last_imported = await async_import_battery_statistics(hass, series, since)
+
+    hours = []
+    for call in add_statistics.call_args_list:
+        metadata, rows = call.args[1:]
+        if metadata["statistic_id"] == "saj_esolar_cloud:battery_voltage":
+            for row in rows:
+                # Every row only holds samples from its own UTC hour
+                assert row["min"] == row["max"] == row["start"].hour
+                hours.append(row["start"])
+    return last_imported, hours
+
+
+def test_merge_skips_known_samples_and_trims_to_window() -> None:
+    """Overlapping polls only add new samples and old ones fall out of the window."""
+    series = BatterySeries(600)
+    samples = [(float(t), {"batVoltage": t, "batTemperature": 20}) for t in range(0, 960, 60)]
+
+    assert series.merge(reversed(samples[:10])) == 10
+    assert series.merge(samples) == 6
+    assert series.merge(samples) == 0
+    assert series.newest == 900.0
+    assert len(series) == 11
+    assert series.stats("batVoltage") == {"min": 300.0, "max": 900.0, "mean": 600.0}
+
+
+def test_stats_skip_missing_values() -> None:
+    """Missing or invalid values are kept as gaps and left out of the stats."""
+    series = BatterySeries(3600)
+    series.merge(
+        [
+            (0.0, {"batVoltage": "52.0", "batTemperature": None}),
+            (60.0, {"batVoltage": "bad"}),
+            (120.0, {"batVoltage": 54, "batTemperature": ""}),
+            (180.0, {"batVoltage": 56}),
+        ]
+    )
+
+    assert len(series) == 4
+    assert series.stats("batVoltage") == {"min": 52.0, "max": 56.0, "mean": 54.0}
+    assert series.stats("batVoltage", 60, 180) == {"min": 54.0, "max": 54.0, "mean": 54.0}
+    assert series.stats("batTemperature") is None
+    assert math.isnan(series._values["batTemperature"][0])
+
+
+async def test_import_from_scratch_imports_the_last_completed_hour(hass: HomeAssistant) -> None:
+    """Without a previous import only the last completed hour is imported."""
+    series = BatterySeries(7200)
+    series.merge(_samples(datetime(2025, 6, 1, 10, 0, tzinfo=dt_util.UTC), 150))
+
+    last_imported, hours = await _async_import(hass, series, None)
+
+    assert hours == [datetime(2025, 6, 1, 11, 0, tzinfo=dt_util.UTC)]
+    assert last_imported == hours[-1]
+
+
+@pytest.mark.parametrize(
+    ("time_zone", "start", "make_samples"),
+    [
+        # Clocks go forward at 02:00 local time
+        ("Europe/Amsterdam", datetime(2025, 3, 29, 23, 0, tzinfo=dt_util.UTC), _local_samples),
+        # Clocks go back at 03:00 local time, repeating the 02:00 hour. Local
+        # times without an offset cannot tell the two 02:00 hours apart, so
+        # the samples are given as timestamps
+        ("Europe/Amsterdam", datetime(2025, 10, 25, 23, 0, tzinfo=dt_util.UTC), _samples),
+        # Local hours start at half past the UTC hour
+        ("Asia/Kolkata", datetime(2025, 6, 1, 0, 0, tzinfo=dt_util.UTC), _local_samples),
+    ],
+)
+async def test_import_resumes_in_utc_hours(hass: HomeAssistant, time_zone: str, start: datetime, make_samples) -> None:
+    """Every completed UTC hour after the previous import is imported exactly once."""
+    hass.config.set_time_zone(time_zone)
+    series = BatterySeries(6 * 3600)
+    series.merge(make_samples(start, 5 * 60 + 10))
+    assert len(series) == 5 * 60 + 10
+
+    last_imported, hours = await _async_import(hass, series, start)
+
+    assert hours == [start + timedelta(hours=offset) for offset in range(1, 5)]
+    assert last_imported == hours[-1]
+
+    # Nothing new until the next hour completes
+    assert await _async_import(hass, series, last_imported) == (last_imported, [])
+
+
+async def test_missing_time_key_warns_once(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    """A series without any known time key is reported once, with its keys."""
+    response = MagicMock(status=200)
+    response.json = AsyncMock(return_value={"result": "OK", "list": [[{"batVoltage": "52.1", "stamp": "10:00"}]]})
+    response.__aenter__.return_value = response
+    session = MagicMock()
+    session.post.return_value = response
+    coordinator = SAJeSolarDataUpdateCoordinator(hass, session, "user", "password")
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            battery_data, _ = await coordinator._async_fetch_battery("H1SN0001")
+
+    assert battery_data == {"batVoltage": "52.1", "stamp": "10:00"}
+    assert len(coordinator.battery_series) == 0
+    warnings = [record for record in caplog.records if "No battery sample has a time" in record.message]
+    assert len(warnings) == 1
+    assert "'batVoltage', 'stamp'" in warnings[0].message
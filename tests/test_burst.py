@@ -0,0 +1,112 @@
+"""Tests for SAJ eSolar burst polling."""
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.saj_esolar_cloud.const import (
+    BURST_DAILY_REQUEST_BUDGET,
+    BURST_REQUESTS_PER_POLL,
+    BURST_STORAGE_SAVE_DELAY,
+    DOMAIN,
+    SERVICE_START_BURST,
+)
+from custom_components.saj_esolar_cloud.coordinator import (
+    SAJeSolarDataUpdateCoordinator,
+    burst_storage_key,
+)
+from custom_components.saj_esolar_cloud.services import (
+    START_BURST_SCHEMA,
+    async_setup_services,
+)
+
+
+def _coordinator(hass: HomeAssistant) -> SAJeSolarDataUpdateCoordinator:
+    return SAJeSolarDataUpdateCoordinator(hass, MagicMock(), "user", "password")
+
+
+async def test_budget_survives_restart(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Used burst requests are stored and restored for the same day."""
+    coordinator = _coordinator(hass)
+    await coordinator.async_load_burst_budget("entry")
+    assert coordinator.burst_budget_remaining == BURST_DAILY_REQUEST_BUDGET
+
+    coordinator._use_burst_budget(BURST_REQUESTS_PER_POLL)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=BURST_STORAGE_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    assert hass_storage[burst_storage_key("entry")]["data"]["requests_used"] == BURST_REQUESTS_PER_POLL
+
+    restarted = _coordinator(hass)
+    await restarted.async_load_burst_budget("entry")
+    assert restarted.burst_budget_remaining == BURST_DAILY_REQUEST_BUDGET - BURST_REQUESTS_PER_POLL
+
+
+async def test_budget_resets_on_a_new_day(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Usage stored for an earlier day does not count today."""
+    hass_storage[burst_storage_key("entry")] = {
+        "version": 1,
+        "key": burst_storage_key("entry"),
+        "data": {"date": "2000-01-01", "requests_used": BURST_DAILY_REQUEST_BUDGET},
+    }
+    coordinator = _coordinator(hass)
+    await coordinator.async_load_burst_budget("entry")
+    assert coordinator.burst_budget_remaining == BURST_DAILY_REQUEST_BUDGET
+
+    coordinator._use_burst_budget(BURST_REQUESTS_PER_POLL)
+    assert coordinator.burst_budget_remaining == BURST_DAILY_REQUEST_BUDGET - BURST_REQUESTS_PER_POLL
+
+
+def test_interval_must_be_faster_than_normal_polling() -> None:
+    """A burst interval at or above the normal interval is rejected."""
+    assert START_BURST_SCHEMA({"duration": "00:05:00", "interval": "00:00:30"})
+    with pytest.raises(vol.Invalid):
+        START_BURST_SCHEMA({"duration": "00:05:00", "interval": "00:05:00"})
+    with pytest.raises(vol.Invalid):
+        START_BURST_SCHEMA({"duration": "00:05:00", "interval": "00:00:10"})
+
+
+async def test_full_refresh_during_burst_fetches_everything(hass: HomeAssistant) -> None:
+    """A forced full refresh does not use the real-time path or the budget."""
+    coordinator = _coordinator(hass)
+    coordinator.data = {"chart_data": {}}
+    coordinator.device_sn = "H1SN0001"
+    coordinator._burst_until = dt_util.now() + timedelta(minutes=5)
+
+    with patch.object(
+        coordinator, "_async_update_all_data", AsyncMock(return_value={})
+    ) as update_all, patch.object(
+        coordinator, "_async_update_realtime_data", AsyncMock(return_value={})
+    ) as update_realtime:
+        await coordinator.async_refresh()
+        assert update_realtime.await_count == 1
+        assert update_all.await_count == 0
+
+        await coordinator.async_full_refresh()
+        assert update_realtime.await_count == 1
+        assert update_all.await_count == 1
+
+    coordinator.async_stop_burst()
+
+
+async def test_exhausted_budget_does_not_block_other_entries(hass: HomeAssistant) -> None:
+    """Entries with budget left start bursting even if an earlier one cannot."""
+    exhausted, available = _coordinator(hass), _coordinator(hass)
+    exhausted._use_burst_budget(BURST_DAILY_REQUEST_BUDGET)
+    hass.data[DOMAIN] = {"exhausted": exhausted, "available": available}
+    await async_setup_services(hass)
+
+    with patch.object(SAJeSolarDataUpdateCoordinator, "async_refresh", AsyncMock()):
+        with pytest.raises(HomeAssistantError, match="exhausted for exhausted$"):
+            await hass.services.async_call(
+                DOMAIN, SERVICE_START_BURST, {"duration": "00:05:00"}, blocking=True
+            )
+
+    assert not exhausted.burst_active
+    assert available.burst_active
+    available.async_stop_burst()
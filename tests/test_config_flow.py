@@ -0,0 +1,64 @@
+"""Tests for the SAJ eSolar Cloud options flow."""
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.saj_esolar_cloud.const import (
+    CONF_MQTT_ENABLED,
+    CONF_MQTT_TOPIC,
+    DOMAIN,
+)
+
+
+@pytest.mark.parametrize(
+    "topic",
+    ["saj/state", "saj/{device_sn}/#", "saj/+/{device_sn}", "{device_sn}/{plant}", "{0}/{device_sn}"],
+)
+async def test_options_reject_invalid_topic(hass: HomeAssistant, topic: str) -> None:
+    """Topics without {device_sn}, with wildcards or other fields are rejected."""
+    hass.config.components.add("mqtt")
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MQTT_ENABLED: True, CONF_MQTT_TOPIC: topic}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_topic"}
+
+
+async def test_options_accept_valid_topic(hass: HomeAssistant) -> None:
+    """A topic with {device_sn} and no wildcards is stored."""
+    hass.config.components.add("mqtt")
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MQTT_ENABLED: True, CONF_MQTT_TOPIC: "home/saj/{device_sn}"}
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {CONF_MQTT_ENABLED: True, CONF_MQTT_TOPIC: "home/saj/{device_sn}"}
+
+
+async def test_options_require_mqtt_when_enabled(hass: HomeAssistant) -> None:
+    """Publishing cannot be enabled before the MQTT integration is set up."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MQTT_ENABLED: True, CONF_MQTT_TOPIC: "home/saj/{device_sn}"}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "mqtt_not_set_up"}
+
+    # Disabling publishing does not need MQTT
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_MQTT_ENABLED: False, CONF_MQTT_TOPIC: "home/saj/{device_sn}"}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
@@ -0,0 +1,62 @@
+"""Tests for the SAJ eSolar local energy estimation."""
+from datetime import datetime, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.saj_esolar_cloud.energy import EnergyIntegrator, realtime_flows
+
+POWER = {
+    "gridPower": "1200",
+    "gridDirection": "1",
+    "batteryPower": "600",
+    "batteryDirection": "-1",
+    "pvPower": "3000",
+    "totalLoadPower": "1200",
+}
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 10, 19, hour, tzinfo=dt_util.DEFAULT_TIME_ZONE) + timedelta(minutes=minute)
+
+
+def test_integrates_signed_flows() -> None:
+    """Export and charge get the power, import and discharge stay at zero."""
+    integrator = EnergyIntegrator()
+    for minute in range(0, 65, 5):
+        integrator.update(_at(10, minute), realtime_flows(POWER))
+
+    assert integrator.as_dict() == {
+        "gridImport": 0.0,
+        "gridExport": 1.2,
+        "batteryCharge": 0.6,
+        "batteryDischarge": 0.0,
+        "pvGeneration": 3.0,
+        "consumption": 1.2,
+    }
+
+
+def test_resets_at_midnight_and_skips_gaps() -> None:
+    """Only the part after midnight counts, and long gaps are not integrated."""
+    integrator = EnergyIntegrator()
+    integrator.update(_at(23, 50), realtime_flows(POWER))
+    integrator.update(_at(23, 50) + timedelta(minutes=15), realtime_flows(POWER))
+    assert integrator.as_dict()["pvGeneration"] == 0.25
+
+    integrator.update(_at(23, 50) + timedelta(hours=2), realtime_flows(POWER))
+    assert integrator.as_dict()["pvGeneration"] == 0.25
+
+
+def test_reconcile_never_decreases() -> None:
+    """Higher totals are taken over, lower ones are absorbed by later energy."""
+    integrator = EnergyIntegrator()
+    for minute in range(0, 65, 5):
+        integrator.update(_at(10, minute), realtime_flows(POWER))
+
+    integrator.reconcile(_at(11), {"sellElec": "1.0", "todayElectricity": "4.5"})
+    assert integrator.as_dict()["gridExport"] == 1.2
+    assert integrator.as_dict()["pvGeneration"] == 4.5
+
+    # 0.6 kWh exported in the next half hour, 0.2 kWh of it absorbed
+    for minute in range(5, 35, 5):
+        integrator.update(_at(11, minute), realtime_flows(POWER))
+    assert integrator.as_dict()["gridExport"] == 1.6
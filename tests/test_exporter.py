@@ -0,0 +1,189 @@
+"""Tests for the SAJ eSolar history export."""
+import asyncio
+from datetime import date
+import os
+import random
+import tracemalloc
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.saj_esolar_cloud import exporter
+from custom_components.saj_esolar_cloud.exporter import async_export_history
+
+
+class MockPortal:
+    """Coordinator stand-in serving synthetic chart responses."""
+
+    device_sn = "H1SN0001"
+
+    def __init__(
+        self,
+        plant_uid: str = "plant",
+        fail_on: date | None = None,
+        without_series_on: date | None = None,
+    ) -> None:
+        """Initialize the portal."""
+        self.plant_uid = plant_uid
+        self.fail_on = fail_on
+        self.without_series_on = without_series_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def async_login(self, session: Any) -> None:
+        """Log in."""
+
+    async def async_logout(self, session: Any) -> None:
+        """Log out."""
+
+    async def async_fetch_chart(self, session: Any, plant_uid: str, device_sn: str, day: date) -> dict[str, Any]:
+        """Return a day with a 288 point series per power, built on demand."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if day == self.fail_on:
+                raise ValueError("Attempt to decode JSON with unexpected mimetype")
+            # Keep the rest of a failing window in flight so it gets cancelled
+            await asyncio.sleep(1 if self.fail_on else 0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+        chart: dict[str, Any] = {
+            "viewBean": {
+                "useElec": f"{random.uniform(5, 20):.2f}",
+                "buyElec": f"{random.uniform(0, 10):.2f}",
+                "sellElec": f"{random.uniform(0, 10):.2f}",
+                "chargeElec": f"{random.uniform(0, 5):.2f}",
+                "dischargeElec": f"{random.uniform(0, 5):.2f}",
+            },
+        }
+        if day != self.without_series_on:
+            chart.update(
+                {
+                    "pvPower": [round(random.uniform(0, 5000), 1) for _ in range(288)],
+                    "loadPower": [round(random.uniform(0, 3000), 1) for _ in range(288)],
+                    "gridPower": [round(random.uniform(-3000, 3000), 1) for _ in range(288)],
+                    "batteryPower": [round(random.uniform(-2500, 2500), 1) for _ in range(288)],
+                }
+            )
+        return chart
+
+
+def _read_lines(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as export_file:
+        return export_file.read().splitlines()
+
+
+@pytest.fixture(autouse=True)
+def fast_rate_limit():
+    """Do not wait between requests in tests."""
+    with patch.object(exporter, "EXPORT_REQUESTS_PER_SECOND", 1_000_000):
+        yield
+
+
+async def _peak_export_memory(hass: HomeAssistant, num_days: int) -> int:
+    """Return the traced memory peak of exporting num_days of 5 minute rows."""
+    portal = MockPortal()
+    start = date(2025, 1, 1)
+    end = date.fromordinal(start.toordinal() + num_days - 1)
+
+    tracemalloc.start()
+    try:
+        result = await async_export_history(hass, portal, start, end, "5min")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result["rows"] == num_days * 288
+    assert len(_read_lines(result["path"])) == num_days * 288 + 1
+    assert portal.max_in_flight <= 4
+    return peak
+
+
+async def test_exporting_a_year_keeps_memory_flat(hass: HomeAssistant, tmp_path) -> None:
+    """Exporting a year of 5 minute rows needs no more memory than a month."""
+    hass.config.config_dir = str(tmp_path)
+    month_peak = await _peak_export_memory(hass, 30)
+    year_peak = await _peak_export_memory(hass, 365)
+
+    # A year of responses would take tens of MiB if it were held at once
+    assert year_peak < 2 * 1024 * 1024
+    assert year_peak < month_peak * 1.5
+
+
+async def test_export_writes_a_row_per_day(hass: HomeAssistant, tmp_path) -> None:
+    """The export is moved into place once every day is written."""
+    hass.config.config_dir = str(tmp_path)
+
+    result = await async_export_history(hass, MockPortal(), date(2025, 1, 1), date(2025, 12, 31), "day")
+
+    assert result["days"] == result["rows"] == 365
+    assert os.listdir(tmp_path) == ["saj_esolar_cloud_export_plant_2025-01-01_2025-12-31_day.csv"]
+    lines = _read_lines(result["path"])
+    assert lines[0] == "date,useElec,buyElec,sellElec,chargeElec,dischargeElec"
+    assert lines[1].startswith("2025-01-01,")
+    assert len(lines) == 366
+
+
+async def test_export_writes_a_row_per_slot(hass: HomeAssistant, tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    """Slots are timed from midnight and days without the series are skipped."""
+    hass.config.config_dir = str(tmp_path)
+    portal = MockPortal(without_series_on=date(2025, 1, 2))
+
+    result = await async_export_history(hass, portal, date(2025, 1, 1), date(2025, 1, 3), "5min")
+
+    assert result == {
+        "path": str(tmp_path / "saj_esolar_cloud_export_plant_2025-01-01_2025-01-03_5min.csv"),
+        "days": 3,
+        "rows": 2 * 288,
+        "skipped_days": 1,
+    }
+    lines = _read_lines(result["path"])
+    assert lines[0] == "time,pvPower,loadPower,gridPower,batteryPower"
+    assert lines[1].startswith("2025-01-01 00:00,")
+    assert lines[288].startswith("2025-01-01 23:55,")
+    assert lines[289].startswith("2025-01-03 00:00,")
+    assert "Skipped 1 of 3 days" in caplog.text
+    assert "keys of 2025-01-02 are ['viewBean']" in caplog.text
+
+
+def test_slot_rows_reject_unexpected_series() -> None:
+    """Missing series leave empty cells, too many values skip the day."""
+    rows = exporter.slot_rows(date(2025, 1, 1), {"pvPower": [1, 2], "gridPower": [3], "loadPower": "n/a"})
+    assert rows == [["2025-01-01 00:00", 1, "", 3, ""], ["2025-01-01 00:05", 2, "", "", ""]]
+
+    assert exporter.slot_rows(date(2025, 1, 1), {"viewBean": {}}) is None
+    assert exporter.slot_rows(date(2025, 1, 1), {"pvPower": [0] * 289}) is None
+
+
+async def test_exports_of_different_plants_do_not_overwrite(hass: HomeAssistant, tmp_path) -> None:
+    """Each config entry's plant gets its own export file."""
+    hass.config.config_dir = str(tmp_path)
+
+    for plant_uid in ("plant_a", "plant_b"):
+        await async_export_history(hass, MockPortal(plant_uid), date(2025, 1, 1), date(2025, 1, 1), "day")
+
+    assert sorted(os.listdir(tmp_path)) == [
+        "saj_esolar_cloud_export_plant_a_2025-01-01_2025-01-01_day.csv",
+        "saj_esolar_cloud_export_plant_b_2025-01-01_2025-01-01_day.csv",
+    ]
+
+
+async def test_failed_export_leaves_no_file(hass: HomeAssistant, tmp_path) -> None:
+    """A failing day cancels the other fetches and removes the partial file."""
+    hass.config.config_dir = str(tmp_path)
+    portal = MockPortal(fail_on=date(2025, 1, 3))
+
+    with pytest.raises(HomeAssistantError, match="unexpected mimetype"):
+        await async_export_history(hass, portal, date(2025, 1, 1), date(2025, 12, 31), "5min")
+
+    assert os.listdir(tmp_path) == []
+    assert portal.cancelled > 0
+    assert portal.in_flight == 0
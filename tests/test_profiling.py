@@ -0,0 +1,80 @@
+"""Tests for the SAJ eSolar profile_refresh service."""
+import asyncio
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.saj_esolar_cloud.const import DOMAIN, SERVICE_PROFILE_REFRESH
+from custom_components.saj_esolar_cloud.energy import realtime_flows
+from custom_components.saj_esolar_cloud.services import async_setup_services
+
+PROFILING_MODULE = "custom_components.saj_esolar_cloud.profiling"
+
+
+def _coordinator() -> MagicMock:
+    """Return a coordinator stand-in whose refresh waits and does some work."""
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+
+    async def async_full_refresh() -> None:
+        await asyncio.sleep(0.05)
+        for _ in range(100):
+            realtime_flows(
+                {
+                    "gridPower": "200",
+                    "batteryPower": "500",
+                    "gridDirection": "1",
+                    "batteryDirection": "-1",
+                    "pvPower": "1500",
+                    "totalLoadPower": "800",
+                }
+            )
+
+    coordinator.async_full_refresh = async_full_refresh
+    return coordinator
+
+
+async def test_profiling_is_loaded_on_demand(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Setting up the services does not import the profiling machinery."""
+    monkeypatch.delitem(sys.modules, PROFILING_MODULE, raising=False)
+    monkeypatch.delitem(sys.modules, "cProfile", raising=False)
+
+    await async_setup_services(hass)
+
+    assert PROFILING_MODULE not in sys.modules
+    assert "cProfile" not in sys.modules
+
+
+async def test_profile_refresh_writes_profile_and_report(hass: HomeAssistant, tmp_path) -> None:
+    """The profile and report are written and the summary skips the event loop."""
+    hass.config.config_dir = str(tmp_path)
+    hass.data[DOMAIN] = {"entry": _coordinator()}
+    await async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_PROFILE_REFRESH, blocking=True, return_response=True
+    )
+
+    result = response["entry"]
+    assert set(result) == {
+        "duration_s",
+        "success",
+        "profile_path",
+        "report_path",
+        "top_functions",
+        "top_allocations",
+    }
+    assert result["success"] is True
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        os.path.basename(result[key]) for key in ("profile_path", "report_path")
+    )
+    assert any("realtime_flows" in function for function in result["top_functions"])
+    assert not any("base_events" in function for function in result["top_functions"])
+    assert not any("select" in function for function in result["top_functions"])
+    with open(result["report_path"], encoding="utf-8") as report:
+        assert "Top allocation sites" in report.read()
@@ -0,0 +1,78 @@
+"""Tests for the SAJ eSolar MQTT publisher."""
+import asyncio
+import json
+from typing import Any
+from unittest.mock import ANY, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.saj_esolar_cloud.const import DEFAULT_MQTT_TOPIC
+from custom_components.saj_esolar_cloud.publisher import SAJeSolarMqttPublisher
+
+
+def _coordinator(pv_power: str) -> MagicMock:
+    """Return a coordinator stand-in with a minimal snapshot."""
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.device_sn = "H1SN0001"
+    coordinator.data = {
+        "device_power": {
+            "storeDevicePower": {
+                "pvPower": pv_power,
+                "gridPower": "200",
+                "gridDirection": "1",
+                "isOnline": "1",
+            }
+        }
+    }
+    return coordinator
+
+
+async def _async_publish(hass: HomeAssistant, publisher: SAJeSolarMqttPublisher) -> None:
+    """Handle an update and wait for the background publish it creates."""
+    tasks: list[asyncio.Task] = []
+    create_task = hass.async_create_background_task
+
+    def async_create_background_task(*args: Any, **kwargs: Any) -> asyncio.Task:
+        task = create_task(*args, **kwargs)
+        tasks.append(task)
+        return task
+
+    with patch.object(hass, "async_create_background_task", async_create_background_task):
+        publisher.async_handle_update()
+    await asyncio.gather(*tasks)
+
+
+async def test_publishes_retained_snapshot_only_on_change(hass: HomeAssistant, mqtt_mock) -> None:
+    """A retained message is published per device, and only when it changed."""
+    coordinator = _coordinator("1500")
+    publisher = SAJeSolarMqttPublisher(hass, coordinator, DEFAULT_MQTT_TOPIC)
+
+    await _async_publish(hass, publisher)
+    mqtt_mock.async_publish.assert_called_once_with(
+        "saj_esolar_cloud/H1SN0001/state", ANY, 0, True
+    )
+    payload = json.loads(mqtt_mock.async_publish.call_args.args[1])
+    assert payload["pvPower"] == 1500.0
+    assert payload["gridPower"] == -200.0
+    assert payload["batVoltage"] is None
+
+    # Same values, nothing new to publish
+    await _async_publish(hass, publisher)
+    assert mqtt_mock.async_publish.call_count == 1
+
+    coordinator.data["device_power"]["storeDevicePower"]["pvPower"] = "1600"
+    await _async_publish(hass, publisher)
+    assert mqtt_mock.async_publish.call_count == 2
+    payload = json.loads(mqtt_mock.async_publish.call_args.args[1])
+    assert payload["pvPower"] == 1600.0
+
+
+async def test_failed_update_is_not_published(hass: HomeAssistant, mqtt_mock) -> None:
+    """Nothing is published after a failed refresh."""
+    coordinator = _coordinator("1500")
+    coordinator.last_update_success = False
+    publisher = SAJeSolarMqttPublisher(hass, coordinator, DEFAULT_MQTT_TOPIC)
+
+    await _async_publish(hass, publisher)
+    mqtt_mock.async_publish.assert_not_called()